@@ -0,0 +1,9 @@
+"""Test configuration for PyWeatherClock"""
+
+import os
+import sys
+
+# Make the application modules importable, as the launcher scripts do
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
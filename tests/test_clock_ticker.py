@@ -0,0 +1,124 @@
+"""Long-horizon tests for the clock ticker using simulated time"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from ui.clock_ticker import ClockTicker
+from utils.time_source import SimulatedTimeSource
+
+NEW_YORK = ZoneInfo('America/New_York')
+
+
+class Display:
+    """Records the text the ticker asks to show"""
+
+    def __init__(self, deadline=None):
+        self.times = []
+        self.dates = []
+        self.deadline = deadline
+
+    def on_tick(self, utc_now, time_text, date_text):
+        if time_text is not None:
+            self.times.append(time_text)
+        if date_text is not None:
+            self.dates.append(date_text)
+        return self.deadline
+
+
+def make_ticker(start, time_format='%H:%M', date_format='%Y-%m-%d',
+                interval=1000, extra_formats=(), deadline=None):
+    source = SimulatedTimeSource(start.astimezone(timezone.utc), tzinfo=NEW_YORK)
+    display = Display(deadline)
+    ticker = ClockTicker(source, time_format, date_format, interval,
+                         display.on_tick, extra_formats)
+    ticker.start()
+    return source, display, ticker
+
+
+def test_midnight_rollover():
+    start = datetime(2026, 10, 19, 23, 58, 30, tzinfo=NEW_YORK)
+    source, display, _ = make_ticker(start)
+
+    source.advance(minutes=3)
+    assert display.dates == ['2026-10-19', '2026-10-20']
+    assert display.times == ['23:58', '23:59', '00:00', '00:01']
+
+
+def test_dst_spring_forward():
+    start = datetime(2026, 3, 8, 1, 58, tzinfo=NEW_YORK)
+    source, display, _ = make_ticker(start, time_format='%H:%M')
+
+    source.advance(minutes=3)
+    assert display.times == ['01:58', '01:59', '03:00', '03:01']
+
+
+def test_dst_fall_back():
+    start = datetime(2026, 11, 1, 1, 58, tzinfo=NEW_YORK)
+    source, display, _ = make_ticker(start, time_format='%H:%M')
+
+    source.advance(minutes=3)
+    assert display.times == ['01:58', '01:59', '01:00', '01:01']
+
+
+def test_simulated_day_is_fast():
+    start = datetime(2026, 10, 19, tzinfo=NEW_YORK)
+    source, display, ticker = make_ticker(start, time_format='%H:%M')
+
+    began = time.perf_counter()
+    source.advance(hours=24)
+    elapsed = time.perf_counter() - began
+
+    # One tick per minute rather than per second
+    assert ticker.ticks == 24 * 60 + 1
+    assert len(display.times) == 24 * 60 + 1
+    assert display.dates == ['2026-10-19', '2026-10-20']
+    assert elapsed < 1.0
+
+
+def test_seconds_format_ticks_every_second():
+    start = datetime(2026, 10, 19, tzinfo=NEW_YORK)
+    source, display, ticker = make_ticker(start, time_format='%H:%M')
+    source.advance(minutes=1)
+    minute_ticks = ticker.ticks
+
+    source, display, ticker = make_ticker(start, time_format='%H:%M:%S')
+    source.advance(minutes=1)
+    assert minute_ticks == 2
+    assert ticker.ticks == 61
+    assert display.times[-1] == '00:01:00'
+
+
+def test_extra_format_sets_tick_rate():
+    start = datetime(2026, 10, 19, tzinfo=NEW_YORK)
+    source, _, ticker = make_ticker(start, extra_formats=['%H:%M:%S'])
+
+    source.advance(minutes=1)
+    assert ticker.ticks == 61
+
+
+def test_interval_longer_than_resolution():
+    start = datetime(2026, 10, 19, tzinfo=NEW_YORK)
+    source, _, ticker = make_ticker(start, time_format='%H:%M:%S', interval=5000)
+
+    source.advance(minutes=1)
+    assert ticker.ticks == 13
+
+
+def test_deadline_brings_tick_forward():
+    start = datetime(2026, 10, 19, tzinfo=NEW_YORK)
+    deadline = start.astimezone(timezone.utc) + timedelta(seconds=10)
+    source, _, ticker = make_ticker(start, deadline=deadline)
+
+    source.advance(seconds=10)
+    assert ticker.ticks == 2
+
+
+def test_stop():
+    start = datetime(2026, 10, 19, tzinfo=NEW_YORK)
+    source, _, ticker = make_ticker(start)
+
+    ticker.stop()
+    source.advance(hours=1)
+    assert ticker.ticks == 1
+    assert source.pending() == 0
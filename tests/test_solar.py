@@ -0,0 +1,87 @@
+"""Tests for the local sunrise/sunset calculator"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from utils.solar import SolarCalculator
+
+UTC = timezone.utc
+TOLERANCE = timedelta(minutes=2)
+
+LONDON = (51.5074, -0.1278)
+NEW_YORK = (40.7128, -74.0060)
+HONOLULU = (21.3069, -157.8583)
+TROMSO = (69.6492, 18.9553)
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=UTC)
+
+
+# Published sunrise/sunset times, converted to UTC
+@pytest.mark.parametrize("coordinates, day, sunrise, sunset", [
+    (LONDON, date(2026, 6, 21), utc(2026, 6, 21, 3, 43), utc(2026, 6, 21, 20, 21)),
+    (LONDON, date(2026, 12, 21), utc(2026, 12, 21, 8, 4), utc(2026, 12, 21, 15, 53)),
+    (LONDON, date(2026, 3, 20), utc(2026, 3, 20, 6, 4), utc(2026, 3, 20, 18, 12)),
+    (NEW_YORK, date(2026, 10, 19), utc(2026, 10, 19, 11, 12), utc(2026, 10, 19, 22, 10)),
+    # Sunset falls on the next UTC date
+    (HONOLULU, date(2026, 6, 21), utc(2026, 6, 21, 15, 50), utc(2026, 6, 22, 5, 16)),
+])
+def test_known_sun_times(coordinates, day, sunrise, sunset):
+    computed_sunrise, computed_sunset, polar = SolarCalculator(*coordinates).sun_times(day)
+
+    assert polar is None
+    assert abs(computed_sunrise - sunrise) <= TOLERANCE
+    assert abs(computed_sunset - sunset) <= TOLERANCE
+
+
+@pytest.mark.parametrize("day, polar, is_day", [
+    (date(2026, 6, 21), 'day', True),
+    (date(2026, 12, 21), 'night', False),
+])
+def test_polar_day_and_night(day, polar, is_day):
+    solar = SolarCalculator(*TROMSO)
+    noon = datetime.combine(day, datetime.min.time(), UTC) + timedelta(hours=11)
+
+    assert solar.sun_times(day) == (None, None, polar)
+    assert solar.is_daytime(noon) is is_day
+    assert solar.next_event(noon) is None
+
+
+def test_next_event_across_year_boundary():
+    solar = SolarCalculator(*LONDON)
+
+    kind, event_time = solar.next_event(utc(2026, 12, 31, 20))
+    assert kind == 'sunrise'
+    assert abs(event_time - utc(2027, 1, 1, 8, 6)) <= TOLERANCE
+
+
+def test_next_event_sequence():
+    solar = SolarCalculator(*LONDON)
+
+    kind, sunset = solar.next_event(utc(2026, 6, 21, 12))
+    assert kind == 'sunset'
+    kind, sunrise = solar.next_event(sunset + timedelta(seconds=1))
+    assert kind == 'sunrise'
+    assert sunrise.date() == date(2026, 6, 22)
+
+
+@pytest.mark.parametrize("instant, is_day", [
+    # 18:00 HST on June 21, before sunset at 19:16 HST (05:16 UTC June 22)
+    (utc(2026, 6, 22, 4), True),
+    (utc(2026, 6, 22, 6), False),
+    (utc(2026, 6, 21, 15), False),
+    (utc(2026, 6, 21, 16), True),
+])
+def test_is_daytime_far_west(instant, is_day):
+    assert SolarCalculator(*HONOLULU).is_daytime(instant) is is_day
+
+
+def test_table_built_once_per_year():
+    solar = SolarCalculator(*LONDON)
+    solar.is_daytime(utc(2026, 3, 1, 12))
+    solar.is_daytime(utc(2026, 9, 1, 12))
+
+    assert list(solar._tables) == [2026]
+    assert len(solar._tables[2026]) == 365
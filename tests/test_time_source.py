@@ -0,0 +1,76 @@
+"""Tests for the time sources"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from utils.time_source import SimulatedTimeSource, format_resolution
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("fmt, expected", [
+    ("%H:%M:%S.%f", 0),
+    ("%H:%M:%S", 1),
+    ("%Ec", 1),
+    ("%H:%M", 60),
+    ("%OH:%OM", 60),
+    ("%-I:%M %p", 60),
+    ("%H %Z", 60),
+    ("%H", 3600),
+    ("%A, %B %d", 86400),
+    ("100%%M", 86400),
+])
+def test_format_resolution(fmt, expected):
+    assert format_resolution(fmt) == expected
+
+
+def test_callbacks_fire_in_order():
+    source = SimulatedTimeSource(START)
+    fired = []
+    source.after(2000, lambda: fired.append(('b', source.now())))
+    source.after(1000, lambda: fired.append(('a', source.now())))
+
+    assert source.advance(seconds=5) == 2
+    assert fired == [('a', START + timedelta(seconds=1)), ('b', START + timedelta(seconds=2))]
+    assert source.now() == START + timedelta(seconds=5)
+
+
+def test_cancel():
+    source = SimulatedTimeSource(START)
+    fired = []
+    handle = source.after(1000, lambda: fired.append(1))
+    source.after(1000, lambda: fired.append(2))
+    source.cancel(handle)
+
+    assert source.pending() == 1
+    source.advance(seconds=1)
+    assert fired == [2]
+    assert source.pending() == 0
+
+    # Cancelling a handle that already fired is a no-op
+    source.cancel(handle)
+    assert source.pending() == 0
+
+
+def test_run_async_is_inline():
+    source = SimulatedTimeSource(START)
+    fired = []
+    source.run_async(lambda: fired.append(source.now()))
+    assert fired == [START]
+
+
+def test_zero_delay_loop_raises():
+    source = SimulatedTimeSource(START)
+
+    def reschedule():
+        source.after(0, reschedule)
+
+    source.after(0, reschedule)
+    with pytest.raises(RuntimeError):
+        source.advance(seconds=1)
+
+
+def test_naive_start_rejected():
+    with pytest.raises(ValueError):
+        SimulatedTimeSource(datetime(2026, 1, 1))
@@ -0,0 +1,254 @@
+"""Tests for weather polling using simulated time"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from unittest import mock
+
+from requests.exceptions import ConnectionError
+
+from utils.time_source import SimulatedTimeSource, SystemTimeSource
+from utils.weather_api import FETCH_CHECK_INTERVAL, WeatherAPI
+
+START = datetime(2026, 10, 19, tzinfo=timezone.utc)
+
+WEATHER_RESPONSE = {
+    'coord': {'lat': 51.51, 'lon': -0.13},
+    'main': {'temp': 12.4, 'humidity': 81},
+    'weather': [{'id': 800, 'main': 'Clear', 'description': 'clear sky', 'icon': '01n'}],
+    'wind': {'speed': 3.6},
+    'name': 'London',
+    'sys': {'country': 'GB'},
+}
+
+
+def make_response(data):
+    response = mock.Mock()
+    response.json.return_value = data
+    return response
+
+
+def make_api(**weather_config):
+    config = {'weather': dict({'api_key': 'test-key', 'location': 'London'}, **weather_config)}
+    return WeatherAPI(config, time_source=SimulatedTimeSource(START))
+
+
+def test_refresh_count_over_a_day():
+    with mock.patch('utils.weather_api.requests.get',
+                    return_value=make_response(WEATHER_RESPONSE)) as get:
+        api = make_api(update_interval=900000)
+        updates = []
+        api.start_updates(on_update=lambda: updates.append(api.time_source.now()))
+        get.reset_mock()
+        updates.clear()
+
+        api.time_source.advance(hours=24)
+
+    assert get.call_count == 96
+    assert len(updates) == 96
+    assert api.get_weather()['temperature'] == '12°C'
+    assert api.get_coordinates() == (51.51, -0.13)
+
+
+def test_errors_keep_polling():
+    with mock.patch('utils.weather_api.requests.get',
+                    side_effect=ConnectionError("offline")) as get:
+        api = make_api(update_interval=900000)
+        api.start_updates()
+        get.reset_mock()
+        api.time_source.advance(hours=1)
+
+    assert get.call_count == 4
+    assert api.get_weather() is None
+    assert api.get_error() == "Connection error"
+
+
+def test_stop_updates():
+    with mock.patch('utils.weather_api.requests.get',
+                    return_value=make_response(WEATHER_RESPONSE)) as get:
+        api = make_api(update_interval=900000)
+        api.start_updates()
+        api.stop_updates()
+        get.reset_mock()
+
+        api.time_source.advance(hours=24)
+
+    assert get.call_count == 0
+
+
+AIR_POLLUTION_RESPONSE = {'list': [{'main': {'aqi': 2}}]}
+ONECALL_RESPONSE = {'current': {'uvi': 3.46}}
+
+
+def fake_get(url, params, timeout):
+    """Route requests to canned responses by endpoint"""
+    endpoint = url.rsplit('/', 1)[-1]
+    if endpoint == 'weather':
+        return make_response(WEATHER_RESPONSE)
+    if endpoint == 'air_pollution':
+        return make_response(AIR_POLLUTION_RESPONSE)
+    return make_response(ONECALL_RESPONSE)
+
+
+def endpoints(get):
+    return [call.args[0].rsplit('/', 1)[-1] for call in get.call_args_list]
+
+
+def test_no_optional_fields_fetches_only_weather():
+    with mock.patch('utils.weather_api.requests.get', side_effect=fake_get) as get:
+        api = make_api()
+        api.start_updates()
+
+    assert endpoints(get) == ['weather']
+    data = api.get_weather()
+    assert 'humidity' not in data
+    assert 'city' not in data
+    assert 'air_quality' not in data
+
+
+def test_initial_fields_fetched_once():
+    with mock.patch('utils.weather_api.requests.get', side_effect=fake_get) as get:
+        api = make_api()
+        api.set_required_fields({'humidity', 'wind', 'air_quality', 'uv_index'}, fetch=False)
+        api.start_updates()
+
+    assert endpoints(get) == ['weather', 'air_pollution', 'onecall']
+    data = api.get_weather()
+    assert data['humidity'] == '81%'
+    assert data['wind'] == '4 m/s'
+    assert data['air_quality'] == 'Fair'
+    assert data['uv_index'] == '3.5'
+
+
+def test_adding_field_fetches_and_removing_stops_calls():
+    with mock.patch('utils.weather_api.requests.get', side_effect=fake_get) as get:
+        api = make_api(update_interval=900000)
+        api.start_updates()
+        get.reset_mock()
+
+        api.set_required_fields({'air_quality'})
+        assert endpoints(get) == ['weather', 'air_pollution']
+        assert api.get_weather()['air_quality'] == 'Fair'
+
+        get.reset_mock()
+        api.set_required_fields(set())
+        api.time_source.advance(hours=1)
+
+    assert endpoints(get) == ['weather'] * 4
+
+
+def test_stale_fetch_does_not_overwrite_newer_data():
+    api = make_api()
+    started = []
+
+    def overlapping_get(url, params, timeout):
+        # While the first fetch is in flight, a panel is expanded and a
+        # second fetch runs to completion
+        if not started:
+            started.append(url)
+            api.set_required_fields({'air_quality'})
+        return fake_get(url, params, timeout)
+
+    with mock.patch('utils.weather_api.requests.get', side_effect=overlapping_get):
+        api.update_weather()
+
+    assert api.get_weather()['air_quality'] == 'Fair'
+
+
+
+def test_stale_fetch_does_not_overwrite_newer_coordinates():
+    api = make_api()
+    api.set_required_fields({'air_quality'}, fetch=False)
+    paris = dict(WEATHER_RESPONSE, coord={'lat': 48.85, 'lon': 2.35}, name='Paris')
+    pollution_coordinates = []
+
+    def overlapping_get(url, params, timeout):
+        if url.endswith('/air_pollution'):
+            pollution_coordinates.append((params['lat'], params['lon']))
+            return make_response(AIR_POLLUTION_RESPONSE)
+        if params['q'] == 'Paris':
+            return make_response(paris)
+        # The location changes while the London fetch is in flight
+        if api.location == 'London':
+            api.set_location('Paris')
+        return make_response(WEATHER_RESPONSE)
+
+    with mock.patch('utils.weather_api.requests.get', side_effect=overlapping_get):
+        api.update_weather()
+
+    # Each fetch queried air quality for its own location
+    assert pollution_coordinates == [(48.85, 2.35), (51.51, -0.13)]
+    assert api.get_coordinates() == (48.85, 2.35)
+
+class ManualScheduler:
+    """Scheduler whose callbacks only run when the test runs them"""
+
+    def __init__(self):
+        self.jobs = []
+
+    def after(self, delay_ms, callback):
+        job = (delay_ms, callback)
+        self.jobs.append(job)
+        return job
+
+    def cancel(self, handle):
+        if handle in self.jobs:
+            self.jobs.remove(handle)
+
+    def run_due(self, elapsed_ms):
+        """Run the jobs whose delay is at most elapsed_ms"""
+        due = [job for job in self.jobs if job[0] <= elapsed_ms]
+        for job in due:
+            self.jobs.remove(job)
+            job[1]()
+
+
+def test_on_update_runs_on_scheduler_thread():
+    scheduler = ManualScheduler()
+    threads = []
+    api = WeatherAPI({'weather': {'api_key': 'test-key'}}, time_source=SystemTimeSource())
+
+    release = threading.Event()
+
+    def slow_get(url, params, timeout):
+        release.wait(5)
+        return fake_get(url, params, timeout)
+
+    with mock.patch('utils.weather_api.requests.get', side_effect=slow_get):
+        api.start_updates(on_update=lambda: threads.append(threading.current_thread()),
+                          scheduler=scheduler)
+        assert api.is_updating()
+        release.set()
+
+        deadline = time.monotonic() + 5
+        while api.is_updating() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    # The fetch thread never calls on_update itself
+    assert not api.is_updating()
+    assert threads == []
+
+    # Run the fetch check, but not the next poll
+    scheduler.run_due(FETCH_CHECK_INTERVAL)
+    assert threads == [threading.current_thread()]
+    assert api.get_weather()['temperature'] == '12°C'
+
+    # The check loop stops once nothing is running; only the poll remains
+    assert [delay for delay, _ in scheduler.jobs] == [api.update_interval]
+    api.stop_updates()
+    assert scheduler.jobs == []
+
+
+def test_configured_coordinates():
+    api = make_api(latitude="48.85", longitude=2.35)
+    assert api.get_coordinates() == (48.85, 2.35)
+
+
+def test_invalid_configured_coordinates_fall_back_to_api():
+    with mock.patch('utils.weather_api.requests.get', side_effect=fake_get):
+        api = make_api(latitude="", longitude=[1])
+        assert api.get_coordinates() is None
+
+        api.update_weather()
+
+    assert api.get_coordinates() == (51.51, -0.13)
@@ -0,0 +1,134 @@
+"""Tests for the world clock offset cache and grid updates"""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import customtkinter as ctk
+import pytest
+
+from ui.world_clock import WorldClockGrid, ZoneClock
+
+UTC = timezone.utc
+
+
+class StubLabel:
+    """Records configure() calls in place of a CTkLabel"""
+
+    def __init__(self):
+        self.texts = []
+
+    def configure(self, text):
+        self.texts.append(text)
+
+
+def make_grid(zones, time_format):
+    """Build a WorldClockGrid with stub labels instead of Tk widgets"""
+    def init_ui(grid):
+        grid._time_labels = [StubLabel() for _ in grid.clocks]
+
+    with mock.patch.object(ctk.CTkFrame, '__init__', return_value=None), \
+            mock.patch.object(WorldClockGrid, '_init_ui', init_ui):
+        return WorldClockGrid(None, zones, time_format=time_format)
+
+
+@pytest.mark.parametrize("zone, before, transition, offset_before, offset_after", [
+    # Spring forward: 02:00 EST -> 03:00 EDT
+    ('America/New_York', datetime(2026, 3, 6, tzinfo=UTC),
+     datetime(2026, 3, 8, 7, tzinfo=UTC), -5, -4),
+    # Fall back: 02:00 EDT -> 01:00 EST
+    ('America/New_York', datetime(2026, 10, 30, tzinfo=UTC),
+     datetime(2026, 11, 1, 6, tzinfo=UTC), -4, -5),
+    # Southern hemisphere fall back: 03:00 AEDT -> 02:00 AEST
+    ('Australia/Sydney', datetime(2026, 4, 1, tzinfo=UTC),
+     datetime(2026, 4, 4, 16, tzinfo=UTC), 11, 10),
+])
+def test_find_next_change(zone, before, transition, offset_before, offset_after):
+    clock = ZoneClock(zone)
+
+    assert clock.refresh(before)
+    assert clock.valid_until == transition
+    assert clock.offset == timedelta(hours=offset_before)
+
+    # The cached offset is reused until the transition
+    assert not clock.refresh(transition - timedelta(seconds=1))
+    assert clock.refresh(transition)
+    assert clock.offset == timedelta(hours=offset_after)
+
+
+def test_no_transition_within_lookahead():
+    clock = ZoneClock('Asia/Tokyo')
+    start = datetime(2026, 6, 1, 12, 30, 15, 500000, tzinfo=UTC)
+
+    clock.refresh(start)
+    assert clock.valid_until == datetime(2026, 6, 8, 12, 30, 15, tzinfo=UTC)
+
+
+def test_wall_time_across_spring_forward():
+    grid = make_grid(['America/New_York'], '%H:%M %Z %z')
+    label = grid._time_labels[0]
+
+    start = datetime(2026, 3, 8, 6, 58, tzinfo=UTC)
+    for minute in range(4):
+        grid.update_clocks(start + timedelta(minutes=minute))
+
+    assert label.texts == ['01:58 EST -0500', '01:59 EST -0500',
+                           '03:00 EDT -0400', '03:01 EDT -0400']
+
+
+def test_wall_time_across_fall_back():
+    grid = make_grid(['America/New_York'], '%H:%M %Z')
+    label = grid._time_labels[0]
+
+    start = datetime(2026, 11, 1, 5, 58, tzinfo=UTC)
+    for minute in range(4):
+        grid.update_clocks(start + timedelta(minutes=minute))
+
+    assert label.texts == ['01:58 EDT', '01:59 EDT', '01:00 EST', '01:01 EST']
+
+
+def test_half_hour_and_quarter_hour_zones():
+    grid = make_grid(['Asia/Kolkata', 'Asia/Kathmandu'], '%H:%M %z')
+
+    grid.update_clocks(datetime(2026, 10, 19, 12, tzinfo=UTC))
+    assert [label.texts for label in grid._time_labels] == [
+        ['17:30 +0530'], ['17:45 +0545']
+    ]
+
+
+def test_literal_percent_z_is_not_substituted():
+    grid = make_grid(['Europe/London'], '%H:%M %%Z')
+
+    grid.update_clocks(datetime(2026, 1, 5, 9, 15, tzinfo=UTC))
+    assert grid._time_labels[0].texts == ['09:15 %Z']
+
+
+def test_labels_only_reconfigured_when_text_changes():
+    grid = make_grid(['Europe/London', 'Europe/Dublin', 'Asia/Tokyo'], '%H:%M')
+    start = datetime(2026, 1, 5, 9, 15, tzinfo=UTC)
+
+    # Ticks every second for two minutes: text changes once per minute
+    for second in range(120):
+        grid.update_clocks(start + timedelta(seconds=second))
+
+    assert [label.texts for label in grid._time_labels] == [
+        ['09:15', '09:16'], ['09:15', '09:16'], ['18:15', '18:16']
+    ]
+
+
+def test_zones_sharing_an_offset_are_formatted_once():
+    grid = make_grid(['Europe/London', 'Europe/Dublin', 'Africa/Abidjan'], '%H:%M %Z')
+    instant = datetime(2026, 1, 5, 9, 15, tzinfo=UTC)
+
+    with mock.patch.object(ZoneClock, 'wall_time', autospec=True,
+                           side_effect=lambda clock, now: now.astimezone(clock.fixed_tz)) as wall_time:
+        grid.update_clocks(instant)
+        # London and Dublin share (UTC+0, GMT); Abidjan is (UTC+0, GMT) too
+        assert wall_time.call_count == 1
+
+        grid.update_clocks(instant + timedelta(seconds=30))
+        assert wall_time.call_count == 1
+
+
+def test_invalid_zones_are_skipped():
+    grid = make_grid([None, 5, {'zone': None}, 'Nope/Nowhere', 'Asia/Tokyo'], '%H:%M')
+    assert [clock.zone_name for clock in grid.clocks] == ['Asia/Tokyo']
@@ -0,0 +1,123 @@
+"""
+Clock ticker for PyWeatherClock.
+Drives the time/date display loop independently of Tk so it can be run
+against a simulated time source.
+"""
+
+import logging
+import math
+
+from utils.time_source import format_resolution
+
+logger = logging.getLogger('PyWeatherClock.UI')
+
+# Longest gap between ticks; DST transitions fall on minute boundaries
+MAX_TICK_RESOLUTION = 60
+
+
+class ClockTicker:
+    """
+    Time/date update loop
+
+    Reads the time once per tick, formats the time and date text only when
+    it can have changed, and schedules the next tick for the next moment
+    any displayed text changes rather than at a fixed interval.
+    """
+
+    def __init__(self, time_source, time_format, date_format, update_interval,
+                 on_tick, extra_formats=()):
+        """
+        Args:
+            time_source: SystemTimeSource or SimulatedTimeSource
+            time_format (str): strftime format for the time
+            date_format (str): strftime format for the date
+            update_interval (int): Minimum tick interval in milliseconds
+            on_tick (callable): Called as on_tick(utc_now, time_text, date_text)
+                with None for text that hasn't changed; may return a datetime
+                by which the next tick must happen
+            extra_formats (iterable): Other displayed formats (e.g. world
+                clock) whose resolution the tick rate must follow
+        """
+        self.logger = logger
+        self.time_source = time_source
+        self.time_format = time_format
+        self.date_format = date_format
+        self.update_interval = update_interval
+        self.on_tick = on_tick
+
+        # How often (in seconds) each format's text can change
+        self.time_resolution = format_resolution(time_format)
+        self.date_resolution = format_resolution(date_format)
+        self.tick_resolution = min(
+            [self.time_resolution, self.date_resolution, MAX_TICK_RESOLUTION]
+            + [format_resolution(fmt) for fmt in extra_formats]
+        )
+
+        # Wall-clock buckets of the last formatted time/date
+        self._time_bucket = None
+        self._date_bucket = None
+        self._job = None
+        self.ticks = 0
+
+    def start(self):
+        """Run the first tick and keep ticking"""
+        self._tick()
+
+    def stop(self):
+        """Cancel the scheduled tick"""
+        self.time_source.cancel(self._job)
+        self._job = None
+
+    @staticmethod
+    def _format_bucket(wall_seconds, resolution):
+        """Get the wall-clock interval a format's text belongs to (None if uncacheable)"""
+        if not resolution:
+            return None
+        return int(wall_seconds // resolution)
+
+    def _tick(self):
+        """Update the display and schedule the next tick"""
+        self.ticks += 1
+        utc_now = self.time_source.now()
+        wall_seconds = utc_now.timestamp()
+        deadline = None
+
+        try:
+            local = utc_now.astimezone(self.time_source.tzinfo)
+            wall_seconds += local.utcoffset().total_seconds()
+            now = local.replace(tzinfo=None)
+
+            time_text = None
+            time_bucket = self._format_bucket(wall_seconds, self.time_resolution)
+            if time_bucket is None or time_bucket != self._time_bucket:
+                time_text = now.strftime(self.time_format)
+                self._time_bucket = time_bucket
+
+            date_text = None
+            date_bucket = self._format_bucket(wall_seconds, self.date_resolution)
+            if date_bucket is None or date_bucket != self._date_bucket:
+                date_text = now.strftime(self.date_format)
+                self._date_bucket = date_bucket
+
+            deadline = self.on_tick(utc_now, time_text, date_text)
+        except Exception as e:
+            self.logger.error(f"Error updating time: {e}")
+
+        delay = self._next_delay(utc_now, wall_seconds, deadline)
+        self._job = self.time_source.after(delay, self._tick)
+
+    def _next_delay(self, utc_now, wall_seconds, deadline):
+        """
+        Get the delay until the next tick in milliseconds
+
+        Ticks land on the next resolution boundary (or earlier deadline),
+        unless the configured interval is longer than the resolution.
+        """
+        resolution = self.tick_resolution
+        if not resolution or resolution * 1000 < self.update_interval:
+            return self.update_interval
+
+        delay = resolution - (wall_seconds % resolution)
+        if deadline is not None:
+            delay = min(delay, max((deadline - utc_now).total_seconds(), 0))
+        return max(math.ceil(delay * 1000), 1)
@@ -6,22 +6,34 @@ Main UI component displaying time, date, and weather information.
 import customtkinter as ctk
 from PIL import Image, ImageTk, ImageFont
 import time
-from datetime import datetime
+from datetime import timedelta
 import logging
+import math
 import os
 import threading
 
+from ui.clock_ticker import ClockTicker
+from ui.detail_panels import DETAIL_PANELS
+from ui.world_clock import WorldClockGrid
+from utils.solar import SolarCalculator
+from utils.time_source import SystemTimeSource
+
 logger = logging.getLogger('PyWeatherClock.UI')
 
 class ClockWidget(ctk.CTkFrame):
     """Main widget displaying time, date, and weather information"""
     
-    def __init__(self, master, config, weather_api, **kwargs):
+    def __init__(self, master, config, weather_api, time_source=None, config_manager=None, **kwargs):
         super().__init__(master, **kwargs)
         
         self.logger = logger
         self.config = config
         self.weather_api = weather_api
+        # Used to save UI state changes such as collapsed panels
+        self.config_manager = config_manager
+        
+        # Time source for reading the clock and scheduling updates
+        self.time_source = time_source or SystemTimeSource(self)
         
         # Font configurations
         self.time_font_size = config.get('ui', {}).get('time_font_size', 48)
@@ -36,12 +48,48 @@ class ClockWidget(ctk.CTkFrame):
         self.time_update_interval = config.get('time', {}).get('update_interval', 1000)
         self.weather_update_interval = config.get('weather', {}).get('update_interval', 900000)
         
+        # World clock configuration
+        self.world_clock_config = config.get('world_clock', {})
+        self.world_clock = None
+        
+        # Optional weather detail panels
+        self.detail_panel_names = config.get('ui', {}).get('detail_panels', [])
+        self.detail_panels = []
+        
+        # Sun-driven theme, icon variant and countdown
+        self.theme = config.get('ui', {}).get('theme', 'Dark')
+        self.show_sun_countdown = config.get('ui', {}).get('show_sun_countdown', True)
+        self.solar = None
+        self._is_day = None
+        self._next_sun_event = None
+        self._sun_text = None
+        
+        # "Auto" follows the system theme until the location is known
+        if self.theme == 'Auto':
+            ctk.set_appearance_mode('System')
+        
         # Create UI components
         self._init_ui()
         
+        # Time/date loop, ticking when the displayed text can change
+        extra_formats = [self.world_clock.time_format] if self.world_clock else []
+        self.ticker = ClockTicker(
+            self.time_source,
+            self.time_format,
+            self.date_format,
+            self.time_update_interval,
+            self._update_time,
+            extra_formats
+        )
+        
         # Start update loops
-        self._update_time()
+        self.ticker.start()
         self._update_weather()
+        self.weather_api.start_updates(
+            self.weather_update_interval,
+            on_update=self._update_weather,
+            scheduler=self.time_source
+        )
     
     def _init_ui(self):
         """Initialize UI components"""
@@ -99,23 +147,164 @@ class ClockWidget(ctk.CTkFrame):
         )
         self.weather_desc_label.grid(row=0, column=2, padx=5, pady=5)
         
-    def _update_time(self):
-        """Update time and date display"""
-        try:
-            # Get current time and date
-            now = datetime.now()
-            time_str = now.strftime(self.time_format)
-            date_str = now.strftime(self.date_format)
-            
-            # Update labels
-            self.time_label.configure(text=time_str)
-            self.date_label.configure(text=date_str)
+        self.sun_label = None
+        if self.show_sun_countdown:
+            self.sun_label = ctk.CTkLabel(
+                self.weather_frame, 
+                text="", 
+                font=ctk.CTkFont(size=max(self.weather_font_size - 4, 8))
+            )
+            self.sun_label.grid(row=1, column=0, columnspan=3, padx=5, pady=(0, 5))
+        
+        # Optional detail panels below the weather
+        collapsed = self.config.get('ui', {}).get('collapsed_panels', [])
+        for name in self.detail_panel_names:
+            panel_class = DETAIL_PANELS.get(name)
+            if not panel_class:
+                self.logger.warning(f"Unknown detail panel: {name}")
+                continue
             
-        except Exception as e:
-            self.logger.error(f"Error updating time: {e}")
+            panel = panel_class(
+                self,
+                name,
+                font_size=max(self.weather_font_size - 4, 8),
+                expanded=name not in collapsed,
+                on_toggle=self._on_panel_toggle
+            )
+            panel.pack(fill="x", padx=10, pady=(0, 5))
+            self.detail_panels.append(panel)
+        
+        # Set before the first fetch so it already includes panel data
+        self._update_required_fields(fetch=False)
+        
+        # Optional world clock grid below the weather
+        if self.world_clock_config.get('enabled', False) and self.world_clock_config.get('zones'):
+            self.world_clock = WorldClockGrid(
+                self,
+                self.world_clock_config.get('zones', []),
+                time_format=self.world_clock_config.get('format', '%H:%M'),
+                font_size=self.world_clock_config.get('font_size', 14),
+                columns=self.world_clock_config.get('columns', 2)
+            )
+            self.world_clock.pack(fill="x", padx=10, pady=(0, 10))
+        
+    def _update_time(self, utc_now, time_text, date_text):
+        """
+        Update time and date display for a ticker tick
+        
+        Args:
+            utc_now (datetime): Time read for this tick
+            time_text (str): New time text, or None if unchanged
+            date_text (str): New date text, or None if unchanged
+        
+        Returns:
+            datetime: When the sun display next changes, or None
+        """
+        if time_text is not None:
+            self.time_label.configure(text=time_text)
+        if date_text is not None:
+            self.date_label.configure(text=date_text)
+        
+        if self.world_clock:
+            self.world_clock.update_clocks(utc_now)
         
-        # Schedule next update
-        self.after(self.time_update_interval, self._update_time)
+        return self._update_sun(utc_now)
+    
+    def _update_required_fields(self, fetch=True):
+        """Tell the weather API which fields the expanded panels need"""
+        fields = set()
+        for panel in self.detail_panels:
+            if panel.expanded:
+                fields.update(panel.fields)
+        self.weather_api.set_required_fields(fields, fetch=fetch)
+    
+    def _on_panel_toggle(self, panel):
+        """Handle a detail panel being collapsed or expanded"""
+        collapsed = self.config.setdefault('ui', {}).setdefault('collapsed_panels', [])
+        if panel.expanded and panel.name in collapsed:
+            collapsed.remove(panel.name)
+        elif not panel.expanded and panel.name not in collapsed:
+            collapsed.append(panel.name)
+        
+        if self.config_manager:
+            self.config_manager.save_config(self.config)
+        
+        # Expanding fetches the new data; the display refreshes again when
+        # it arrives (on_update runs on the Tk thread)
+        self._update_required_fields()
+        panel.render(self.weather_api.get_weather())
+    
+    def _update_sun(self, utc_now):
+        """
+        Update day/night state, Auto theme and sunrise/sunset countdown
+        
+        Returns:
+            datetime: When the sun display next changes, or None
+        """
+        coordinates = self.weather_api.get_coordinates()
+        if not coordinates:
+            # Location unknown (or changed and not resolved yet)
+            self.solar = None
+            self._next_sun_event = None
+            if self.sun_label:
+                self._update_sun_countdown(utc_now)
+            return None
+        
+        # Rebuild the calculator only when the location changes
+        if not self.solar or (self.solar.latitude, self.solar.longitude) != coordinates:
+            self.solar = SolarCalculator(*coordinates)
+            self._is_day = None
+            self._next_sun_event = None
+        
+        # Day/night only changes at the next event, so recheck only then
+        if self._next_sun_event is None or utc_now >= self._next_sun_event[1]:
+            self._next_sun_event = self.solar.next_event(utc_now)
+            is_day = self.solar.is_daytime(utc_now)
+            if is_day != self._is_day:
+                self._is_day = is_day
+                self._apply_day_night()
+        
+        if self.sun_label:
+            self._update_sun_countdown(utc_now)
+        
+        # Polar day/night: no event to count down to
+        if not self._next_sun_event:
+            return None
+        
+        event_time = self._next_sun_event[1]
+        if not self.sun_label:
+            return event_time
+        
+        # The countdown text changes whenever a whole minute remains
+        remaining = (event_time - utc_now).total_seconds()
+        return utc_now + timedelta(seconds=remaining % 60 or 60)
+    
+    def _apply_day_night(self):
+        """Apply the Auto theme and day/night icon variant"""
+        if self.theme == 'Auto':
+            ctk.set_appearance_mode('Light' if self._is_day else 'Dark')
+        
+        weather_data = self.weather_api.get_weather()
+        if weather_data:
+            self.weather_icon_label.configure(text=self._weather_icon_symbol(weather_data))
+    
+    def _update_sun_countdown(self, utc_now):
+        """Show the time remaining until the next sunrise or sunset"""
+        text = ""
+        if self._next_sun_event:
+            kind, event_time = self._next_sun_event
+            minutes = math.ceil((event_time - utc_now).total_seconds() / 60)
+            hours, minutes = divmod(minutes, 60)
+            remaining = f"{hours} h {minutes} min" if hours else f"{minutes} min"
+            text = f"{kind.capitalize()} in {remaining}"
+        
+        if text != self._sun_text:
+            self.sun_label.configure(text=text)
+            self._sun_text = text
+    
+    def _weather_icon_symbol(self, weather_data):
+        """Get the weather icon, using the local day/night state when known"""
+        return self.weather_api.get_icon_symbol(weather_data['icon_code'], self._is_day)
     
     def _update_weather(self):
         """Update weather display"""
@@ -126,7 +315,7 @@ class ClockWidget(ctk.CTkFrame):
             
             if weather_data:
                 # Update weather display with data
-                self.weather_icon_label.configure(text=weather_data['icon_symbol'])
+                self.weather_icon_label.configure(text=self._weather_icon_symbol(weather_data))
                 self.weather_temp_label.configure(text=weather_data['temperature'])
                 self.weather_desc_label.configure(text=weather_data['description'])
             elif error:
@@ -139,16 +328,19 @@ class ClockWidget(ctk.CTkFrame):
                 self.weather_icon_label.configure(text="🔄")
                 self.weather_temp_label.configure(text="--")
                 self.weather_desc_label.configure(text="Loading...")
-                
-            # Request fresh data
-            self.weather_api.update_weather()
+            
+            for panel in self.detail_panels:
+                panel.render(weather_data)
             
         except Exception as e:
             self.logger.error(f"Error updating weather display: {e}")
             self.weather_desc_label.configure(text="Display error")
-        
-        # Schedule next update
-        self.after(self.weather_update_interval, self._update_weather)
+    
+    def destroy(self):
+        """Stop the update loops before destroying the widget"""
+        self.ticker.stop()
+        self.weather_api.stop_updates()
+        super().destroy()
     
     def set_custom_font(self, font_path):
         """
@@ -0,0 +1,129 @@
+"""
+Detail panels for PyWeatherClock.
+Optional collapsible panels showing extra weather data; each panel declares
+the weather fields it needs so only those are fetched.
+"""
+
+import customtkinter as ctk
+import logging
+
+logger = logging.getLogger('PyWeatherClock.UI')
+
+
+class DetailPanel(ctk.CTkFrame):
+    """Base class for a collapsible weather detail panel"""
+
+    # Panel title and the WeatherAPI.OPTIONAL_FIELDS it needs
+    title = ""
+    fields = ()
+    # (label, weather data key) pairs shown in the panel body
+    rows = ()
+
+    def __init__(self, master, name, font_size=14, expanded=True, on_toggle=None, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.logger = logger
+        self.name = name
+        self.font_size = font_size
+        self.expanded = expanded
+        self.on_toggle = on_toggle
+        self._value_labels = {}
+
+        self._init_ui()
+
+    def _init_ui(self):
+        """Initialize the header toggle and value rows"""
+        self.configure(corner_radius=0)
+
+        self.header_button = ctk.CTkButton(
+            self,
+            text=self._header_text(),
+            font=ctk.CTkFont(size=self.font_size),
+            fg_color="transparent",
+            anchor="w",
+            command=self.toggle
+        )
+        self.header_button.pack(fill="x")
+
+        self.body_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
+        self.body_frame.columnconfigure(1, weight=1)
+
+        for row, (label, key) in enumerate(self.rows):
+            name_label = ctk.CTkLabel(
+                self.body_frame,
+                text=label,
+                font=ctk.CTkFont(size=self.font_size)
+            )
+            name_label.grid(row=row, column=0, padx=5, sticky="w")
+
+            value_label = ctk.CTkLabel(
+                self.body_frame,
+                text="--",
+                font=ctk.CTkFont(size=self.font_size)
+            )
+            value_label.grid(row=row, column=1, padx=5, sticky="e")
+            self._value_labels[key] = value_label
+
+        if self.expanded:
+            self.body_frame.pack(fill="x")
+
+    def _header_text(self):
+        return f"{'▾' if self.expanded else '▸'} {self.title}"
+
+    def toggle(self):
+        """Collapse or expand the panel body"""
+        self.expanded = not self.expanded
+        if self.expanded:
+            self.body_frame.pack(fill="x")
+        else:
+            self.body_frame.pack_forget()
+        self.header_button.configure(text=self._header_text())
+
+        if self.on_toggle:
+            self.on_toggle(self)
+
+    def render(self, weather_data):
+        """
+        Show values from weather data
+
+        Args:
+            weather_data (dict): Processed weather data, or None
+        """
+        if not self.expanded:
+            return
+
+        for key, label in self._value_labels.items():
+            value = weather_data.get(key) if weather_data else None
+            label.configure(text=value if value is not None else "--")
+
+
+class HumidityWindPanel(DetailPanel):
+    """Humidity and wind speed"""
+
+    title = "Humidity & Wind"
+    fields = ('humidity', 'wind')
+    rows = (("Humidity", 'humidity'), ("Wind", 'wind'))
+
+
+class AirQualityPanel(DetailPanel):
+    """Air quality index"""
+
+    title = "Air Quality"
+    fields = ('air_quality',)
+    rows = (("AQI", 'air_quality'),)
+
+
+class UVIndexPanel(DetailPanel):
+    """UV index"""
+
+    title = "UV Index"
+    fields = ('uv_index',)
+    rows = (("UV", 'uv_index'),)
+
+
+# Panel names usable in the ui.detail_panels config setting
+DETAIL_PANELS = {
+    'humidity_wind': HumidityWindPanel,
+    'air_quality': AirQualityPanel,
+    'uv': UVIndexPanel,
+}
@@ -0,0 +1,207 @@
+"""
+World Clock grid for PyWeatherClock.
+Displays the time in several timezones from a single shared time source.
+"""
+
+import customtkinter as ctk
+from datetime import timedelta, timezone
+import logging
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from utils.time_source import format_resolution
+
+logger = logging.getLogger('PyWeatherClock.WorldClock')
+
+# How far ahead to look for the next UTC offset change before re-checking
+OFFSET_LOOKAHEAD = timedelta(days=7)
+
+
+class ZoneClock:
+    """Cached UTC offset and abbreviation for a single timezone"""
+
+    def __init__(self, zone_name, label=None):
+        self.tz = ZoneInfo(zone_name)
+        self.zone_name = zone_name
+        self.label = label or zone_name.split('/')[-1].replace('_', ' ')
+
+        # Cached offset data, valid while utc_now < valid_until
+        self.offset = None
+        self.offset_seconds = 0
+        self.abbreviation = ''
+        self.fixed_tz = None
+        self.valid_until = None
+
+    def refresh(self, utc_now):
+        """
+        Make sure the cached offset is valid for the given instant
+
+        Only does real work when the previous offset has expired, i.e.
+        at DST transitions or once per lookahead window.
+
+        Args:
+            utc_now (datetime): Current time as an aware UTC datetime
+
+        Returns:
+            bool: True if the offset or abbreviation was recomputed
+        """
+        if self.valid_until is not None and utc_now < self.valid_until:
+            return False
+
+        local = utc_now.astimezone(self.tz)
+        self.offset = local.utcoffset()
+        self.offset_seconds = self.offset.total_seconds()
+        self.abbreviation = local.tzname() or ''
+        self.fixed_tz = timezone(self.offset, self.abbreviation)
+        self.valid_until = self._find_next_change(utc_now)
+        return True
+
+    def _offset_at(self, utc_time):
+        return utc_time.astimezone(self.tz).utcoffset()
+
+    def _find_next_change(self, utc_now):
+        """Find when the current offset stops applying (or the lookahead end)"""
+        # Transitions fall on whole seconds, so search on a whole-second grid
+        low = utc_now.replace(microsecond=0)
+        high = low + OFFSET_LOOKAHEAD
+
+        # Walk forward a day at a time to bracket the next transition
+        step = timedelta(days=1)
+        probe = low
+        while probe < high:
+            nxt = min(probe + step, high)
+            if self._offset_at(nxt) != self.offset:
+                low, high = probe, nxt
+                break
+            probe = nxt
+        else:
+            return high
+
+        # Bisect in whole seconds down to the transition instant
+        while (high - low).total_seconds() > 1:
+            mid = low + timedelta(seconds=(high - low).total_seconds() // 2)
+            if self._offset_at(mid) == self.offset:
+                low = mid
+            else:
+                high = mid
+        return high
+
+    def wall_time(self, utc_now):
+        """
+        Get local wall time for this zone using the cached offset
+
+        The result carries a fixed-offset timezone, so %Z and %z format
+        as the zone's abbreviation and offset.
+
+        Args:
+            utc_now (datetime): Current time as an aware UTC datetime
+
+        Returns:
+            datetime: Aware local time in this zone
+        """
+        return utc_now.astimezone(self.fixed_tz)
+
+
+class WorldClockGrid(ctk.CTkFrame):
+    """Grid of timezone clocks updated from one shared time reading"""
+
+    def __init__(self, master, zones, time_format='%H:%M', font_size=14, columns=2, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.logger = logger
+        self.time_format = time_format
+        self.resolution = format_resolution(time_format)
+        self.font_size = font_size
+        self.columns = max(1, int(columns))
+
+        self.clocks = []
+        # (offset, abbreviation) -> (wall-clock bucket, text), shared across zones
+        self._text_cache = {}
+
+        for zone in zones:
+            clock = self._create_zone_clock(zone)
+            if clock:
+                self.clocks.append(clock)
+
+        self._time_labels = []
+        self._last_text = [None] * len(self.clocks)
+
+        self._init_ui()
+
+    def _create_zone_clock(self, zone):
+        """Create a ZoneClock from a config entry (name or {'zone', 'label'})"""
+        if isinstance(zone, dict):
+            zone_name = zone.get('zone', '')
+            label = zone.get('label')
+        else:
+            zone_name = zone
+            label = None
+
+        try:
+            return ZoneClock(zone_name, label)
+        except (ZoneInfoNotFoundError, ValueError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Unknown timezone '{zone_name}': {e}")
+            return None
+
+    def _init_ui(self):
+        """Initialize one name/time label pair per zone"""
+        self.configure(corner_radius=0)
+
+        for col in range(self.columns):
+            self.columnconfigure(col, weight=1)
+
+        for index, clock in enumerate(self.clocks):
+            row, col = divmod(index, self.columns)
+
+            cell = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
+            cell.grid(row=row, column=col, padx=5, pady=2, sticky="ew")
+
+            name_label = ctk.CTkLabel(
+                cell,
+                text=clock.label,
+                font=ctk.CTkFont(size=max(self.font_size - 4, 8))
+            )
+            name_label.pack()
+
+            time_label = ctk.CTkLabel(
+                cell,
+                text="--:--",
+                font=ctk.CTkFont(size=self.font_size)
+            )
+            time_label.pack()
+
+            self._time_labels.append(time_label)
+
+    def update_clocks(self, utc_now):
+        """
+        Update all zone labels for the given instant
+
+        Zones sharing an offset and format are formatted once, text is only
+        re-formatted when the format's resolution (e.g. a minute) rolls
+        over, and labels are only reconfigured when their text changes.
+
+        Args:
+            utc_now (datetime): Current time as an aware UTC datetime
+        """
+        timestamp = utc_now.timestamp()
+
+        for index, clock in enumerate(self.clocks):
+            try:
+                clock.refresh(utc_now)
+
+                key = (clock.offset, clock.abbreviation)
+                bucket = None
+                if self.resolution:
+                    bucket = int((timestamp + clock.offset_seconds) // self.resolution)
+
+                cached = self._text_cache.get(key)
+                if bucket is not None and cached and cached[0] == bucket:
+                    text = cached[1]
+                else:
+                    text = clock.wall_time(utc_now).strftime(self.time_format)
+                    self._text_cache[key] = (bucket, text)
+
+                if text != self._last_text[index]:
+                    self._time_labels[index].configure(text=text)
+                    self._last_text[index] = text
+            except Exception as e:
+                self.logger.error(f"Error updating clock for {clock.zone_name}: {e}")
@@ -39,6 +39,8 @@ class ConfigManager:
                 "api_key": "",  # OpenWeatherMap API key
                 "location": "London",  # Default location
                 "units": "metric",  # metric or imperial
+                "latitude": None,  # Optional; resolved from the API when unset
+                "longitude": None,
                 "update_interval": 900000  # 15 minutes in milliseconds
             },
             "time": {
@@ -48,8 +50,18 @@ class ConfigManager:
             "date": {
                 "format": "%A, %B %d"  # e.g., "Tuesday, April 8"
             },
+            "world_clock": {
+                "enabled": False,  # Show a grid of timezone clocks
+                "zones": [],  # IANA names, e.g. "Asia/Tokyo", or {"zone": ..., "label": ...}
+                "format": "%H:%M",  # Time format for each zone (%Z gives the abbreviation)
+                "columns": 2,
+                "font_size": 14
+            },
             "ui": {
-                "theme": "Dark",  # System, Dark, or Light
+                "theme": "Dark",  # System, Dark, Light, or Auto (follows sunrise/sunset once coordinates are known)
+                "show_sun_countdown": True,  # e.g. "Sunset in 42 min"
+                "detail_panels": [],  # Any of "humidity_wind", "air_quality", "uv"
+                "collapsed_panels": [],  # Panels collapsed by the user
                 "color_theme": "blue",
                 "font_path": "",  # Custom font path if specified
                 "time_font_size": 48,
@@ -0,0 +1,160 @@
+"""
+Solar position calculator for PyWeatherClock.
+Computes local sunrise/sunset times without any network access.
+"""
+
+import logging
+import math
+from datetime import date, datetime, timedelta, timezone
+
+logger = logging.getLogger('PyWeatherClock.Solar')
+
+# Julian day of the J2000 epoch (2000-01-01 12:00 UTC)
+J2000 = 2451545.0
+# Julian day of the Unix epoch
+UNIX_EPOCH_JD = 2440587.5
+# Sun altitude at sunrise/sunset, accounting for refraction and disc size
+SUN_ALTITUDE = -0.833
+# Axial tilt of the Earth in degrees
+EARTH_TILT = 23.4397
+
+
+class SolarCalculator:
+    """Sunrise/sunset calculator with a per-year table of daily events"""
+
+    def __init__(self, latitude, longitude):
+        """
+        Args:
+            latitude (float): Latitude in degrees, north positive
+            longitude (float): Longitude in degrees, east positive
+        """
+        self.logger = logger
+        self.latitude = latitude
+        self.longitude = longitude
+
+        # Solar day offset from UTC, used to pick the table day for an instant
+        self._solar_offset = timedelta(hours=longitude / 15)
+        # year -> {date: (sunrise, sunset, polar)}
+        self._tables = {}
+
+    def _compute_day(self, day):
+        """
+        Compute sunrise and sunset for one day using the sunrise equation
+
+        Args:
+            day (date): Calendar day at this longitude
+
+        Returns:
+            tuple: (sunrise, sunset, polar) where sunrise/sunset are aware UTC
+                datetimes, or None with polar set to 'day' or 'night'
+        """
+        n = day.toordinal() - date(2000, 1, 1).toordinal()
+        mean_solar_noon = n - self.longitude / 360
+
+        anomaly = math.radians((357.5291 + 0.98560028 * mean_solar_noon) % 360)
+        center = (1.9148 * math.sin(anomaly)
+                  + 0.0200 * math.sin(2 * anomaly)
+                  + 0.0003 * math.sin(3 * anomaly))
+        ecliptic_longitude = math.radians(
+            (math.degrees(anomaly) + center + 180 + 102.9372) % 360
+        )
+        transit = (J2000 + mean_solar_noon
+                   + 0.0053 * math.sin(anomaly)
+                   - 0.0069 * math.sin(2 * ecliptic_longitude))
+
+        sin_declination = math.sin(ecliptic_longitude) * math.sin(math.radians(EARTH_TILT))
+        cos_declination = math.cos(math.asin(sin_declination))
+        latitude = math.radians(self.latitude)
+
+        cos_hour_angle = (
+            (math.sin(math.radians(SUN_ALTITUDE)) - math.sin(latitude) * sin_declination)
+            / (math.cos(latitude) * cos_declination)
+        )
+        if cos_hour_angle < -1:
+            return None, None, 'day'
+        if cos_hour_angle > 1:
+            return None, None, 'night'
+
+        hour_angle = math.degrees(math.acos(cos_hour_angle))
+        sunrise = self._julian_to_datetime(transit - hour_angle / 360)
+        sunset = self._julian_to_datetime(transit + hour_angle / 360)
+        return sunrise, sunset, None
+
+    @staticmethod
+    def _julian_to_datetime(julian_day):
+        return datetime.fromtimestamp((julian_day - UNIX_EPOCH_JD) * 86400, timezone.utc)
+
+    def _table_for(self, year):
+        """Get (building once) the table of daily events for a year"""
+        table = self._tables.get(year)
+        if table is None:
+            table = {}
+            day = date(year, 1, 1)
+            while day.year == year:
+                table[day] = self._compute_day(day)
+                day += timedelta(days=1)
+            self._tables[year] = table
+            self.logger.debug(f"Built solar table for {year} at {self.latitude}, {self.longitude}")
+        return table
+
+    def solar_date(self, utc_now):
+        """
+        Get the calendar day at this longitude for an instant
+
+        Args:
+            utc_now (datetime): Aware UTC datetime
+
+        Returns:
+            date: Day used to look up the solar table
+        """
+        return (utc_now + self._solar_offset).date()
+
+    def sun_times(self, day):
+        """
+        Get sunrise and sunset for a day
+
+        Args:
+            day (date): Calendar day at this longitude
+
+        Returns:
+            tuple: (sunrise, sunset, polar) as returned by the table
+        """
+        return self._table_for(day.year)[day]
+
+    def is_daytime(self, utc_now):
+        """
+        Check whether the sun is up
+
+        Args:
+            utc_now (datetime): Aware UTC datetime
+
+        Returns:
+            bool: True between sunrise and sunset (or during polar day)
+        """
+        sunrise, sunset, polar = self.sun_times(self.solar_date(utc_now))
+        if polar:
+            return polar == 'day'
+        return sunrise <= utc_now < sunset
+
+    def next_event(self, utc_now):
+        """
+        Get the next sunrise or sunset after an instant
+
+        Looks up to two days ahead; polar day/night may have no event.
+
+        Args:
+            utc_now (datetime): Aware UTC datetime
+
+        Returns:
+            tuple: ('sunrise' or 'sunset', datetime) or None
+        """
+        day = self.solar_date(utc_now) - timedelta(days=1)
+        for offset in range(4):
+            sunrise, sunset, polar = self.sun_times(day + timedelta(days=offset))
+            if polar:
+                continue
+            if sunrise > utc_now:
+                return 'sunrise', sunrise
+            if sunset > utc_now:
+                return 'sunset', sunset
+        return None
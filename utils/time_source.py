@@ -0,0 +1,268 @@
+"""
+Time sources for PyWeatherClock.
+Provides the current time, timers and background execution, with a real
+implementation and a simulated one that can fast-forward through time.
+"""
+
+import heapq
+import itertools
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger('PyWeatherClock.Time')
+
+# Zero-delay callbacks allowed at one simulated instant before assuming a loop
+MAX_CALLBACKS_PER_INSTANT = 10000
+
+# strftime directives grouped by the smallest time unit they display
+_DIRECTIVE_PATTERN = re.compile(r'%[-#_^0]?[EO]?(.)')
+_SUBSECOND_DIRECTIVES = set('f')
+_SECOND_DIRECTIVES = set('STXcrs')
+# Zone name/offset change at DST transitions, which fall on minute boundaries
+_MINUTE_DIRECTIVES = set('MRZz')
+_HOUR_DIRECTIVES = set('HIklp')
+
+
+def format_resolution(fmt):
+    """
+    Get how often a strftime format's output can change
+
+    Args:
+        fmt (str): strftime format string
+
+    Returns:
+        int: Resolution in seconds (0 if it changes more than once a second)
+    """
+    directives = set(d for d in _DIRECTIVE_PATTERN.findall(fmt) if d != '%')
+    if directives & _SUBSECOND_DIRECTIVES:
+        return 0
+    if directives & _SECOND_DIRECTIVES:
+        return 1
+    if directives & _MINUTE_DIRECTIVES:
+        return 60
+    if directives & _HOUR_DIRECTIVES:
+        return 3600
+    return 86400
+
+
+class SystemTimeSource:
+    """Time source backed by the system clock, Tk timers and threads"""
+
+    def __init__(self, widget=None, tzinfo=None):
+        """
+        Args:
+            widget: Tk widget used for after() scheduling; when None,
+                threading.Timer is used instead
+            tzinfo: Timezone for local display, None for the system zone
+        """
+        self.widget = widget
+        self.tzinfo = tzinfo
+
+    def now(self):
+        """
+        Get the current time
+
+        Returns:
+            datetime: Aware datetime in UTC
+        """
+        return datetime.now(timezone.utc)
+
+    def time(self):
+        """
+        Get the current time as a Unix timestamp
+
+        Returns:
+            float: Seconds since the epoch
+        """
+        return time.time()
+
+    def after(self, delay_ms, callback):
+        """
+        Schedule a callback after a delay
+
+        Args:
+            delay_ms (int): Delay in milliseconds
+            callback (callable): Function to call
+
+        Returns:
+            Handle that can be passed to cancel()
+        """
+        if self.widget is not None:
+            return self.widget.after(delay_ms, callback)
+
+        timer = threading.Timer(delay_ms / 1000, callback)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def cancel(self, handle):
+        """
+        Cancel a callback scheduled with after()
+
+        Args:
+            handle: Handle returned by after()
+        """
+        if handle is None:
+            return
+        if isinstance(handle, threading.Timer):
+            handle.cancel()
+        elif self.widget is not None:
+            self.widget.after_cancel(handle)
+
+    def run_async(self, target):
+        """
+        Run a function in the background
+
+        Args:
+            target (callable): Function to run in a daemon thread
+        """
+        threading.Thread(target=target, daemon=True).start()
+
+
+class SimulatedTimeSource:
+    """
+    Virtual time source for fast-forward simulation
+
+    Time only moves when advance() or run_until() is called; scheduled
+    callbacks fire in order as virtual time passes them, and background
+    work runs inline so results are deterministic. Callbacks that keep
+    rescheduling themselves with no delay raise RuntimeError after
+    MAX_CALLBACKS_PER_INSTANT calls at the same instant.
+    """
+
+    def __init__(self, start=None, tzinfo=timezone.utc):
+        """
+        Args:
+            start (datetime): Initial virtual time (aware); defaults to now
+            tzinfo: Timezone for local display
+        """
+        if start is None:
+            start = datetime.now(timezone.utc)
+        elif start.tzinfo is None:
+            raise ValueError("Simulated start time must be timezone-aware")
+
+        self.logger = logger
+        self.tzinfo = tzinfo
+        self._now = start.astimezone(timezone.utc)
+        self._queue = []
+        # Handles still queued, and queued handles that were cancelled
+        self._scheduled = set()
+        self._cancelled = set()
+        self._counter = itertools.count()
+
+    def now(self):
+        """
+        Get the current virtual time
+
+        Returns:
+            datetime: Aware datetime in UTC
+        """
+        return self._now
+
+    def time(self):
+        """
+        Get the current virtual time as a Unix timestamp
+
+        Returns:
+            float: Seconds since the epoch
+        """
+        return self._now.timestamp()
+
+    def after(self, delay_ms, callback):
+        """
+        Schedule a callback after a virtual delay
+
+        Args:
+            delay_ms (int): Delay in milliseconds
+            callback (callable): Function to call
+
+        Returns:
+            int: Handle that can be passed to cancel()
+        """
+        handle = next(self._counter)
+        due = self._now + timedelta(milliseconds=max(delay_ms, 0))
+        heapq.heappush(self._queue, (due, handle, callback))
+        self._scheduled.add(handle)
+        return handle
+
+    def cancel(self, handle):
+        """
+        Cancel a callback scheduled with after()
+
+        Args:
+            handle (int): Handle returned by after()
+        """
+        if handle in self._scheduled:
+            self._scheduled.discard(handle)
+            self._cancelled.add(handle)
+
+    def run_async(self, target):
+        """
+        Run a function immediately in the calling thread
+
+        Args:
+            target (callable): Function to run
+        """
+        target()
+
+    def pending(self):
+        """
+        Get the number of scheduled callbacks that have not fired yet
+
+        Returns:
+            int: Number of pending callbacks
+        """
+        return len(self._scheduled)
+
+    def run_until(self, target_time):
+        """
+        Advance virtual time to target_time, firing due callbacks in order
+
+        Args:
+            target_time (datetime): Aware datetime to advance to
+
+        Returns:
+            int: Number of callbacks fired
+
+        Raises:
+            RuntimeError: If callbacks keep rescheduling at the same instant
+        """
+        fired = 0
+        same_instant = 0
+        while self._queue and self._queue[0][0] <= target_time:
+            due, handle, callback = heapq.heappop(self._queue)
+            if handle in self._cancelled:
+                self._cancelled.discard(handle)
+                continue
+            self._scheduled.discard(handle)
+
+            same_instant = same_instant + 1 if due == self._now else 0
+            if same_instant > MAX_CALLBACKS_PER_INSTANT:
+                raise RuntimeError(f"Zero-delay callback loop at simulated time {due}")
+
+            self._now = due
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Error in simulated callback: {e}")
+            fired += 1
+
+        if target_time > self._now:
+            self._now = target_time
+        return fired
+
+    def advance(self, seconds=0, **kwargs):
+        """
+        Advance virtual time by a duration, firing due callbacks in order
+
+        Args:
+            seconds (float): Seconds to advance
+            **kwargs: Extra timedelta arguments (e.g. hours=24)
+
+        Returns:
+            int: Number of callbacks fired
+        """
+        return self.run_until(self._now + timedelta(seconds=seconds, **kwargs))
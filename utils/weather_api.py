@@ -5,26 +5,78 @@ Handles fetching and processing weather data from OpenWeatherMap.
 
 import requests
 import logging
+import queue
 import threading
-import time
 from requests.exceptions import RequestException
 
+from utils.time_source import SystemTimeSource
+
 logger = logging.getLogger('PyWeatherClock.Weather')
 
+# Milliseconds between checks for finished background fetches
+FETCH_CHECK_INTERVAL = 100
+
 class WeatherAPI:
     """Interface for fetching weather data from OpenWeatherMap API"""
     
-    def __init__(self, config):
+    # Optional data fields and the endpoint each one is fetched from
+    OPTIONAL_FIELDS = {
+        'location': 'weather',
+        'humidity': 'weather',
+        'wind': 'weather',
+        'air_quality': 'air_pollution',
+        'uv_index': 'onecall',
+    }
+    
+    # OpenWeatherMap air quality index levels
+    AQI_LEVELS = {1: "Good", 2: "Fair", 3: "Moderate", 4: "Poor", 5: "Very Poor"}
+    
+    def __init__(self, config, time_source=None):
         self.logger = logger
         self.config = config
+        self.time_source = time_source or SystemTimeSource()
         self.weather_data = None
         self.error = None
         self.api_key = config.get('weather', {}).get('api_key', '')
         self.location = config.get('weather', {}).get('location', 'London')
         self.units = config.get('weather', {}).get('units', 'metric')
         
-        # Base URL for OpenWeatherMap API
+        # Coordinates from config, otherwise resolved from the API response
+        latitude = config.get('weather', {}).get('latitude')
+        longitude = config.get('weather', {}).get('longitude')
+        self.configured_coordinates = None
+        if latitude is not None and longitude is not None:
+            try:
+                self.configured_coordinates = (float(latitude), float(longitude))
+            except (TypeError, ValueError):
+                self.logger.warning(f"Invalid coordinates in config: {latitude!r}, {longitude!r}. "
+                                    "Using the location's coordinates from the weather data.")
+        self.coordinates = self.configured_coordinates
+        
+        # Optional fields requested by visible UI panels
+        self.required_fields = frozenset()
+        
+        # Periodic updates started by start_updates()
+        self.update_interval = config.get('weather', {}).get('update_interval', 900000)
+        self.on_update = None
+        self.scheduler = self.time_source
+        self._poll_job = None
+        
+        # Background fetches report completion through a queue; it is
+        # drained on the scheduler's thread, which then calls on_update
+        self._completed_fetches = queue.Queue()
+        self._active_fetches = 0
+        self._check_job = None
+        
+        # Fetches are numbered so an older one finishing late is discarded
+        self._fetch_lock = threading.Lock()
+        self._fetch_generation = 0
+        self._applied_generation = 0
+        
+        # Base URLs for OpenWeatherMap API
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
+        self.air_pollution_url = "https://api.openweathermap.org/data/2.5/air_pollution"
+        self.onecall_url = "https://api.openweathermap.org/data/3.0/onecall"
         
         # Weather icons mapping (OpenWeatherMap icon codes to descriptions)
         self.weather_icons = {
@@ -47,13 +99,95 @@ class WeatherAPI:
             "50d": "🌫️",  # mist
             "50n": "🌫️",  # mist
         }
+    
+    def update_weather(self):
+        """
+        Fetch updated weather data from API
+        
+        Should be called from the scheduler's thread when on_update is set.
+        """
+        with self._fetch_lock:
+            self._active_fetches += 1
+        self.time_source.run_async(self._fetch_in_background)
+        self._check_fetches()
+    
+    def is_updating(self):
+        """
+        Check whether a fetch is in progress
         
-        # Initial weather fetch
+        Returns:
+            bool: True while any background fetch is running
+        """
+        with self._fetch_lock:
+            return self._active_fetches > 0
+    
+    def start_updates(self, interval_ms=None, on_update=None, scheduler=None):
+        """
+        Fetch weather now and then periodically
+        
+        Call set_required_fields(..., fetch=False) first so the initial
+        fetch already includes the optional data.
+        
+        Args:
+            interval_ms (int): Update interval in milliseconds; defaults to
+                weather.update_interval from config
+            on_update (callable): Called after each fetch completes, on the
+                scheduler's thread
+            scheduler: Time source whose after() runs the polling loop and
+                on_update, e.g. a Tk widget's; defaults to this API's
+        """
+        self.stop_updates()
+        if interval_ms is not None:
+            self.update_interval = interval_ms
+        self.on_update = on_update
+        self.scheduler = scheduler or self.time_source
+        self._poll()
+    
+    def stop_updates(self):
+        """Stop periodic updates"""
+        self.scheduler.cancel(self._poll_job)
+        self.scheduler.cancel(self._check_job)
+        self._poll_job = None
+        self._check_job = None
+    
+    def _poll(self):
+        """Fetch weather and schedule the next periodic fetch"""
         self.update_weather()
+        self._poll_job = self.scheduler.after(self.update_interval, self._poll)
     
-    def update_weather(self):
-        """Fetch updated weather data from API"""
-        threading.Thread(target=self._fetch_weather_data, daemon=True).start()
+    def _fetch_in_background(self):
+        """Fetch weather data, then report completion (runs in the fetch thread)"""
+        try:
+            self._fetch_weather_data()
+        finally:
+            # Queue before decrementing so is_updating() never hides a result
+            self._completed_fetches.put(True)
+            with self._fetch_lock:
+                self._active_fetches -= 1
+    
+    def _check_fetches(self):
+        """Notify about finished fetches, checking again while any are running"""
+        completed = 0
+        while True:
+            try:
+                self._completed_fetches.get_nowait()
+            except queue.Empty:
+                break
+            completed += 1
+        
+        if completed and self.on_update:
+            try:
+                self.on_update()
+            except Exception as e:
+                self.logger.error(f"Error in weather update callback: {e}")
+        
+        if self.on_update and self._check_job is None and self.is_updating():
+            self._check_job = self.scheduler.after(FETCH_CHECK_INTERVAL, self._run_fetch_check)
+    
+    def _run_fetch_check(self):
+        """Scheduled fetch check"""
+        self._check_job = None
+        self._check_fetches()
     
     def _fetch_weather_data(self):
         """Fetch weather data from OpenWeatherMap API in a separate thread"""
@@ -62,6 +196,15 @@ class WeatherAPI:
             self.error = "No API key"
             return
         
+        # Snapshot so a panel toggled mid-fetch doesn't mix requirements
+        with self._fetch_lock:
+            self._fetch_generation += 1
+            generation = self._fetch_generation
+            fields = self.required_fields
+            coordinates = self.coordinates
+        
+        processed_data = None
+        error = None
         try:
             params = {
                 'q': self.location,
@@ -76,24 +219,93 @@ class WeatherAPI:
             self.logger.debug(f"Weather data received: {data}")
             
             # Process data into a more usable format
-            processed_data = self._process_weather_data(data)
-            self.weather_data = processed_data
-            self.error = None
+            processed_data = self._process_weather_data(data, fields)
+            if not self.configured_coordinates and 'coord' in data:
+                coordinates = (data['coord']['lat'], data['coord']['lon'])
+            
+            # Only call the extra endpoints that visible panels need
+            if coordinates:
+                if 'air_quality' in fields:
+                    processed_data.update(self._fetch_air_quality(coordinates))
+                if 'uv_index' in fields:
+                    processed_data.update(self._fetch_uv_index(coordinates))
             
             self.logger.info(f"Weather updated for {self.location}: {processed_data['description']}, {processed_data['temperature']}")
             
         except RequestException as e:
             self.logger.error(f"Error fetching weather data: {e}")
-            self.error = "Connection error"
+            error = "Connection error"
         except ValueError as e:
             self.logger.error(f"Error parsing weather data: {e}")
-            self.error = "Data error"
+            error = "Data error"
         except Exception as e:
             self.logger.error(f"Unexpected error: {e}")
-            self.error = "Unknown error"
+            error = "Unknown error"
+        
+        with self._fetch_lock:
+            if generation < self._applied_generation:
+                self.logger.debug(f"Discarding stale weather fetch {generation}")
+                return
+            self._applied_generation = generation
+            if processed_data is not None:
+                self.weather_data = processed_data
+                self.coordinates = coordinates
+            self.error = error
     
-    def _process_weather_data(self, data):
-        """Process raw weather data into a usable format"""
+    def _fetch_optional(self, url, params, parse, name, coordinates):
+        """
+        Fetch and parse an optional endpoint without failing the main update
+        
+        Args:
+            coordinates (tuple): (latitude, longitude) resolved by this fetch
+        
+        Returns:
+            dict: Parsed fields, or an empty dict on error
+        """
+        lat, lon = coordinates
+        params = dict(params, lat=lat, lon=lon, appid=self.api_key)
+        
+        try:
+            response = requests.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            return parse(response.json())
+        except RequestException as e:
+            self.logger.warning(f"Error fetching {name} data: {e}")
+        except (ValueError, KeyError, IndexError) as e:
+            self.logger.warning(f"Error parsing {name} data: {e}")
+        return {}
+    
+    def _fetch_air_quality(self, coordinates):
+        """Fetch the air quality index for the given coordinates"""
+        def parse(data):
+            aqi = data['list'][0]['main']['aqi']
+            return {
+                'aqi': aqi,
+                'air_quality': self.AQI_LEVELS.get(aqi, str(aqi))
+            }
+        
+        return self._fetch_optional(self.air_pollution_url, {}, parse, "air quality", coordinates)
+    
+    def _fetch_uv_index(self, coordinates):
+        """Fetch the current UV index for the given coordinates"""
+        def parse(data):
+            uvi = data['current']['uvi']
+            return {
+                'uv_value': uvi,
+                'uv_index': f"{uvi:.1f}"
+            }
+        
+        params = {'exclude': 'minutely,hourly,daily,alerts'}
+        return self._fetch_optional(self.onecall_url, params, parse, "UV index", coordinates)
+    
+    def _process_weather_data(self, data, fields=frozenset()):
+        """
+        Process raw weather data into a usable format
+        
+        Args:
+            data (dict): Raw API response
+            fields (set): Optional fields to include (see OPTIONAL_FIELDS)
+        """
         temp = data['main']['temp']
         temp_unit = "°C" if self.units == "metric" else "°F"
         
@@ -103,9 +315,9 @@ class WeatherAPI:
         weather_icon_code = data['weather'][0]['icon']
         
         # Get icon symbol from mapping or fallback
-        icon_symbol = self.weather_icons.get(weather_icon_code, "🌡️")
+        icon_symbol = self.get_icon_symbol(weather_icon_code)
         
-        return {
+        processed = {
             'temperature': f"{round(temp)}{temp_unit}",
             'temp_value': temp,
             'temp_unit': temp_unit,
@@ -113,12 +325,20 @@ class WeatherAPI:
             'main': weather_main,
             'icon_code': weather_icon_code,
             'icon_symbol': icon_symbol,
-            'city': data['name'],
-            'country': data['sys']['country'],
-            'humidity': f"{data['main']['humidity']}%",
-            'wind_speed': data['wind']['speed'],
-            'timestamp': time.time()
+            'timestamp': self.time_source.time()
         }
+        
+        if 'location' in fields:
+            processed['city'] = data['name']
+            processed['country'] = data['sys']['country']
+        if 'humidity' in fields:
+            processed['humidity'] = f"{data['main']['humidity']}%"
+        if 'wind' in fields:
+            speed_unit = "m/s" if self.units == "metric" else "mph"
+            processed['wind_speed'] = data['wind']['speed']
+            processed['wind'] = f"{round(data['wind']['speed'])} {speed_unit}"
+        
+        return processed
     
     def get_weather(self):
         """
@@ -129,6 +349,50 @@ class WeatherAPI:
         """
         return self.weather_data
     
+    def set_required_fields(self, fields, fetch=True):
+        """
+        Set which optional fields to fetch, fetching now if any are new
+        
+        Args:
+            fields (iterable): Names from OPTIONAL_FIELDS
+            fetch (bool): Whether to fetch immediately when fields are added
+        """
+        fields = frozenset(fields)
+        unknown = fields - set(self.OPTIONAL_FIELDS)
+        if unknown:
+            self.logger.warning(f"Ignoring unknown weather fields: {', '.join(sorted(unknown))}")
+            fields -= unknown
+        
+        added = fields - self.required_fields
+        self.required_fields = fields
+        if fetch and added and self.api_key:
+            self.update_weather()
+    
+    def get_icon_symbol(self, icon_code, is_day=None):
+        """
+        Get the icon symbol for an OpenWeatherMap icon code
+        
+        Args:
+            icon_code (str): Icon code such as '01d'
+            is_day (bool): Force the day or night variant; None uses the
+                code's own 'd'/'n' suffix
+        
+        Returns:
+            str: Icon symbol
+        """
+        if is_day is not None and icon_code:
+            icon_code = icon_code[:-1] + ('d' if is_day else 'n')
+        return self.weather_icons.get(icon_code, "🌡️")
+    
+    def get_coordinates(self):
+        """
+        Get the coordinates of the weather location
+        
+        Returns:
+            tuple: (latitude, longitude) or None if not resolved yet
+        """
+        return self.coordinates
+    
     def get_error(self):
         """
         Get current error state
@@ -146,6 +410,7 @@ class WeatherAPI:
             location (str): City name or ZIP code
         """
         self.location = location
+        self.coordinates = self.configured_coordinates
         self.update_weather()
     
     def set_units(self, units):